@@ -1,27 +1,57 @@
 from src.classes.hugging_face_api import HuggingFaceApi  # adjust import to where your class is saved
-from typing import Optional
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+import typing
+import httpx
 
-def get_model_size(namespace: str, repo: str, rev: str = "main") -> float:
+def get_model_metrics(namespace: str, repo: str, rev: str = "main", session: Optional[httpx.Client] = None) -> Tuple[float, str, str]:
+    """
+    Fetch the size, README path and license of a Hugging Face model.
+
+    A single HuggingFaceApi client is shared by all lookups so they reuse the
+    same session (and its pooled connections). Pass `session` to share a pool
+    across models as well. Size and license both come from one model info
+    request, which runs concurrently with the README download.
+
+    Returns:
+        (size, readme_path, license)
+    """
+    api = HuggingFaceApi(namespace, repo, rev, session=session)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        info_future = executor.submit(_get_model_info_with_sizes, api)
+        readme_future = executor.submit(get_model_README, namespace, repo, rev, api=api)
+
+        info = info_future.result()
+        readme_path = readme_future.result()
+
+    size = _get_size_from_siblings(info)
+    license_value = (_get_license_from_tags(info.get("tags", []))
+                     or _get_license_from_readme_file(readme_path)
+                     or "")
+
+    return size, readme_path, license_value
+
+def get_model_size(namespace: str, repo: str, rev: str = "main", api: Optional[HuggingFaceApi] = None) -> float:
     """
     Calculate the total size (bytes) of all files in a Hugging Face model.
     
     If any API call fails, return 0.0
     """
     try:
-        api = HuggingFaceApi(namespace, repo, rev)
-        files_info = api.get_model_files_info()
-        # Sum file sizes, missing sizes are zero
-        total_size = float(sum((f.get("size") or 0) for f in files_info))
-        return total_size
+        if api is None:
+            api = HuggingFaceApi(namespace, repo, rev)
+        return _get_size_from_siblings(api.get_model_info_with_sizes())
     except Exception:
         # On failure, return zero (inaccessible/missing model)
         return 0.0
 
-def get_model_README(namespace: str, repo: str, rev: str = "main") -> str:
-    api = HuggingFaceApi(namespace, repo, rev)
+def get_model_README(namespace: str, repo: str, rev: str = "main", api: Optional[HuggingFaceApi] = None) -> str:
+    if api is None:
+        api = HuggingFaceApi(namespace, repo, rev)
 
-    path_or_paths = api.download_file("model_file_download", "README.md")
+    # READMEs rarely change, so reuse a cached copy when its ETag still matches
+    path_or_paths = api.download_file_cached("model_file_download", "README.md")
 
     # Normalize union type (str | list[str]) to str
     if isinstance(path_or_paths, list):
@@ -31,7 +61,7 @@ def get_model_README(namespace: str, repo: str, rev: str = "main") -> str:
 
     return README_filepath
 
-def get_model_license(namespace: str, repo: str, rev: str = "main") -> str:
+def get_model_license(namespace: str, repo: str, rev: str = "main", api: Optional[HuggingFaceApi] = None) -> str:
     """
     Get license information from HuggingFace model with proper error handling.
     
@@ -39,6 +69,7 @@ def get_model_license(namespace: str, repo: str, rev: str = "main") -> str:
         namespace: Model namespace (e.g., "openai-community")
         repo: Repository name (e.g., "gpt2") 
         rev: Revision/branch (default: "main")
+        api: Optional client to reuse; a new one is created if omitted
     
     Returns:
         License string or empty string if not found/error
@@ -48,21 +79,25 @@ def get_model_license(namespace: str, repo: str, rev: str = "main") -> str:
     if not namespace or not repo:
         return ""
     
+    if api is None:
+        api = HuggingFaceApi(namespace, repo, rev)
+
     try:
         # Try multiple approaches to get license
-        
-        # Approach 1: Check model info API
-        license_info = _get_license_from_api(namespace, repo)
-        if license_info:
-            return license_info
-        
-        # Approach 2: Check tags (your original approach)
-        license_info = _get_license_from_tags(namespace, repo)
+
+        # Approach 1: Check tags. The hub adds a "license:<id>" tag from the model
+        # card, so only the tags are requested instead of the full model info.
+        try:
+            tags = api.get_model_tags()
+        except Exception:
+            tags = []
+
+        license_info = _get_license_from_tags(tags)
         if license_info:
             return license_info
             
-        # Approach 3: Fallback to README parsing
-        license_info = _get_license_from_readme(namespace, repo, rev)
+        # Approach 2: Fallback to README parsing
+        license_info = _get_license_from_readme(api)
         if license_info:
             return license_info
             
@@ -71,64 +106,55 @@ def get_model_license(namespace: str, repo: str, rev: str = "main") -> str:
         
     return ""
 
-def _get_license_from_api(namespace: str, repo: str) -> Optional[str]:
-    """Get license from HuggingFace API model info"""
+def _get_model_info_with_sizes(api: HuggingFaceApi) -> dict[str, typing.Any]:
+    """Model info with per-file sizes, or an empty dict if the request fails"""
     try:
-        url = f"https://huggingface.co/api/models/{namespace}/{repo}"
-        response = requests.get(url, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            # Check multiple possible license fields
-            return (data.get('cardData', {}).get('license') or 
-                   data.get('license') or 
-                   data.get('model_license') or
-                   data.get('modelLicense'))
+        info = api.get_model_info_with_sizes()
+        return info if isinstance(info, dict) else {}
     except Exception:
-        pass
-    return None
+        return {}
+
+def _get_size_from_siblings(info: dict[str, typing.Any]) -> float:
+    """Sum file sizes from model info siblings, missing sizes are zero"""
+    siblings = info.get("siblings") or []
+    return float(sum((s.get("size") or 0) for s in siblings if isinstance(s, dict)))
+
+def _get_license_from_tags(tags: list[typing.Any]) -> Optional[str]:
+    """Get license from model tags"""
+    # Handle multiple possible license tag formats, including the British spelling
+    prefixes = ("license:", "licence:")
+    tag = next((t for t in tags if isinstance(t, str)
+                and (t.startswith(prefixes) or "license" in t.lower())), None)
+    if tag is None:
+        return None
+    return tag[len("license:"):] if tag.startswith(prefixes) else tag
 
-def _get_license_from_tags(namespace: str, repo: str) -> Optional[str]:
-    """Get license from model tags (original approach with error handling)"""
+def _get_license_from_readme(api: HuggingFaceApi) -> Optional[str]:
+    """Extract license from README file as fallback"""
     try:
-        url = f"https://huggingface.co/api/models/{namespace}/{repo}"
-        response = requests.get(url, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            tags = data.get("tags", [])
-            
-            # Look for license in tags
-            for tag in tags:
-                if isinstance(tag, str):
-                    # Handle multiple possible license tag formats
-                    if tag.startswith("license:"):
-                        return tag.split("license:", 1)[-1]
-                    elif tag.startswith("licence:"):  # British spelling
-                        return tag.split("licence:", 1)[-1]
-                    elif "license" in tag.lower():
-                        return tag
+        readme_text = str(api.get(api.build_endpoint("model_file_raw", filename="README.md")))
+        return _find_license_in_readme(readme_text)
     except Exception:
         pass
     return None
 
-def _get_license_from_readme(namespace: str, repo: str, rev: str) -> Optional[str]:
-    """Extract license from README file as fallback"""
+def _get_license_from_readme_file(readme_path: str) -> Optional[str]:
+    """Extract license from an already downloaded README as fallback"""
     try:
-        url = f"https://huggingface.co/{namespace}/{repo}/raw/{rev}/README.md"
-        response = requests.get(url, timeout=10)
-        
-        if response.status_code == 200:
-            readme_text = response.text
-            # Simple license extraction from README
-            if "license" in readme_text.lower():
-                # Extract license section - simplified example
-                lines = readme_text.split('\n')
-                for i, line in enumerate(lines):
-                    if "license" in line.lower() and i + 1 < len(lines):
-                        return lines[i + 1].strip()
-    except Exception:
-        pass
+        with open(readme_path, "r", encoding="utf-8", errors="replace") as f:
+            return _find_license_in_readme(f.read())
+    except OSError:
+        return None
+
+def _find_license_in_readme(readme_text: str) -> Optional[str]:
+    """Return the line following the first mention of a license in README text"""
+    # Simple license extraction from README
+    if "license" in readme_text.lower():
+        # Extract license section - simplified example
+        lines = readme_text.split('\n')
+        for i, line in enumerate(lines):
+            if "license" in line.lower() and i + 1 < len(lines):
+                return lines[i + 1].strip()
     return None
 
 if __name__ == "__main__":
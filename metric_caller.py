@@ -24,7 +24,10 @@ def logger_process(log_queue: multiprocessing.Queue, log_file_path: str):
                 if message is None: # A 'None' message is our signal to stop
                     #f.write(f"--- Log ended at {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n")
                     break
-                f.write(f"{message}\n")
+                if isinstance(message, list): # A batch of messages from one metric call
+                    f.write("".join(f"{m}\n" for m in message))
+                else:
+                    f.write(f"{message}\n")
                 f.flush() # Ensure messages are written immediately
     except Exception:
         pass
@@ -83,13 +86,47 @@ def load_available_functions(directory: str, *_, **__) -> dict:
                 pass
     return functions
 
+def load_tasks(tasks_filename: str) -> list[tuple[str, list[str], float]]:
+    """
+    Parses a tasks file once into (func_name, required_keys, weight) entries.
+    Lines that do not match the `func(key, ...) weight` syntax are skipped.
+    """
+    line_pattern = re.compile(r'(\w+)\((.*)\)\s*([\d.]+)')
+    tasks = []
+    with open(tasks_filename, 'r', encoding="utf-8") as f:
+        for i, line in enumerate(f, 1):
+            line = line.strip()
+            if not line: continue
+            match = line_pattern.match(line)
+            if not match:
+                #log_queue.put(f"[WARNING] Skipped line {i}: Could not parse syntax: '{line}'.")
+                continue
+
+            func_name, keys_str, weight_str = match.groups()
+            tasks.append((func_name, parse_keys_from_string(keys_str), float(weight_str)))
+    return tasks
+
+_manager = None
+
+def _get_manager():
+    """Starts the shared Manager process on first use and reuses it for every later run."""
+    global _manager
+    if _manager is None:
+        _manager = multiprocessing.Manager()
+    return _manager
+
 def run_concurrently_from_file(tasks_filename: str, all_args_dict: dict, available_functions: dict, log_file: str):
     """
     Parses a file, runs functions concurrently, and directs all status updates to the log file.
     """
+    return run_concurrently(load_tasks(tasks_filename), all_args_dict, available_functions, log_file)
+
+def run_concurrently(tasks: list[tuple[str, list[str], float]], all_args_dict: dict, available_functions: dict, log_file: str):
+    """
+    Runs already parsed tasks (see load_tasks) concurrently, and directs all status updates to the log file.
+    """
     script_verbosity = all_args_dict["verbosity"]
-    manager = multiprocessing.Manager()
-    log_queue = manager.Queue()
+    log_queue = _get_manager().Queue()
     
     logger = multiprocessing.Process(target=logger_process, args=(log_queue, log_file))
     logger.start()
@@ -101,53 +138,40 @@ def run_concurrently_from_file(tasks_filename: str, all_args_dict: dict, availab
 
     all_args_dict['log_queue'] = log_queue
 
-    line_pattern = re.compile(r'(\w+)\((.*)\)\s*([\d.]+)')
     processes = []
     results_queue = multiprocessing.Queue()
     total_weight = 0.0
 
     if script_verbosity > 0:
-        log_queue.put(f"[INFO] Reading and parsing tasks from '{tasks_filename}'...")
+        log_queue.put(f"[INFO] Preparing {len(tasks)} parsed tasks...")
     
-    with open(tasks_filename, 'r', encoding="utf-8") as f:
-        for i, line in enumerate(f, 1):
-            line = line.strip()
-            if not line: continue
-            match = line_pattern.match(line)
-            if not match:
-                #log_queue.put(f"[WARNING] Skipped line {i}: Could not parse syntax: '{line}'.")
-                continue
-
-            func_name, keys_str, weight_str = match.groups()
-            
-            if func_name not in available_functions:
-                #log_queue.put(f"[WARNING] Skipped line {i}: Function '{func_name}' not found.")
-                continue
-
-            target_func = available_functions[func_name]
-            required_keys = parse_keys_from_string(keys_str)
-            
-            sig = inspect.signature(target_func)
-            expected_count = len(sig.parameters)
-            provided_count = len(required_keys)
-
-            if provided_count != expected_count:
-                #log_queue.put(f"[WARNING] Skipped line {i}: '{func_name}' expects {expected_count} args, but {provided_count} keys were provided.")
-                continue
-            
-            if not all(key in all_args_dict for key in required_keys):
-                missing = [key for key in required_keys if key not in all_args_dict]
-                #log_queue.put(f"[WARNING] Skipped line {i}: Missing required keys in input dictionary: {missing}")
-                continue
-
-            resolved_args = [all_args_dict[key] for key in required_keys]
-            weight = float(weight_str)
-            process_args = (target_func, results_queue, log_queue, weight, func_name) + tuple(resolved_args)
-            process = multiprocessing.Process(target=process_worker, args=process_args)
-            processes.append(process)
-            total_weight += weight
-            if script_verbosity > 0:
-                log_queue.put(f"[INFO] Queued: {func_name}(...) with weight {weight}")
+    for func_name, required_keys, weight in tasks:
+        if func_name not in available_functions:
+            #log_queue.put(f"[WARNING] Skipped task: Function '{func_name}' not found.")
+            continue
+
+        target_func = available_functions[func_name]
+        
+        sig = inspect.signature(target_func)
+        expected_count = len(sig.parameters)
+        provided_count = len(required_keys)
+
+        if provided_count != expected_count:
+            #log_queue.put(f"[WARNING] Skipped task: '{func_name}' expects {expected_count} args, but {provided_count} keys were provided.")
+            continue
+        
+        if not all(key in all_args_dict for key in required_keys):
+            missing = [key for key in required_keys if key not in all_args_dict]
+            #log_queue.put(f"[WARNING] Skipped task: Missing required keys in input dictionary: {missing}")
+            continue
+
+        resolved_args = [all_args_dict[key] for key in required_keys]
+        process_args = (target_func, results_queue, log_queue, weight, func_name) + tuple(resolved_args)
+        process = multiprocessing.Process(target=process_worker, args=process_args)
+        processes.append(process)
+        total_weight += weight
+        if script_verbosity > 0:
+            log_queue.put(f"[INFO] Queued: {func_name}(...) with weight {weight}")
 
     if not processes:
         if script_verbosity > 0:
@@ -2,39 +2,54 @@ import os
 import sys
 import argparse
 import subprocess
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import httpx
 import metric_caller
 import src.url_class as url_class
-from get_model_metrics import get_model_size, get_model_README, get_model_license
+from get_model_metrics import get_model_metrics
 from src.classes.github_api import GitHubApi
 from src.json_output import build_model_output
 
+# Shared by every outbound request (token checks and Hugging Face lookups).
+# HTTP/2 multiplexes concurrent requests to the same host over one connection.
+_SESSION = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    follow_redirects=True,
+)
+
+# Number of projects whose Hugging Face metadata is fetched concurrently (matches the pool size)
+_MAX_FETCH_WORKERS = 32
 
 def validate_github_token(token: str) -> bool:
     """Checks if a GitHub token is valid by making a simple API call."""
     if not token:
         return False
     try:
-        r = requests.get(
+        r = _SESSION.get(
             "https://api.github.com/zen",
             headers={"Authorization": f"token {token}"},
             timeout=3
         )
         return r.status_code == 200
-    except requests.RequestException:
+    except httpx.HTTPError:
         return False
 
+@lru_cache(maxsize=None)
 def validate_log_file_path(path: str) -> bool:
-    """Checks if the log file path is valid and the directory is writable."""
+    """
+    Checks if the log file path is valid and the directory is writable.
+    The result is cached per path, so re-validating skips the filesystem probe.
+    """
     if not path:
         return False
     try:
         dir_name = os.path.dirname(os.path.abspath(path))
-        if not os.path.isdir(dir_name):
-            os.makedirs(dir_name, exist_ok=True)
+        os.makedirs(dir_name, exist_ok=True)
         if not os.access(dir_name, os.W_OK):
             return False
-    except (OSError, IOError):
+    except OSError:
         return False
     return True
 
@@ -60,7 +75,7 @@ def main() -> int:
         # if not gen_ai_key:
         #     # print("ERROR: GEN_AI_STUDIO_API_KEY environment variable not set.", file=sys.stderr)
         #     sys.exit(1)
-        GitHubApi.verify_token(github_token)
+        GitHubApi.verify_token(github_token, session=_SESSION)
 
     # Non-strict mode: safe defaults
     verbosity_env = (
@@ -80,7 +95,7 @@ def main() -> int:
             print("Warning: Provided GITHUB_TOKEN appears invalid; continuing without it.", file=sys.stderr)
             github_token = None
         else:
-            GitHubApi.verify_token(github_token)
+            GitHubApi.verify_token(github_token, session=_SESSION)
 
     parser = argparse.ArgumentParser(
         prog="run",
@@ -138,7 +153,10 @@ def main() -> int:
         # Running URL FILE
         project_groups: list[url_class.ProjectGroup] = url_class.parse_project_file(args.target)
         x = metric_caller.load_available_functions("src.metrics")
+        tasks = metric_caller.load_tasks("./tasks.txt")
 
+        # Collect the projects that have usable model info
+        jobs: list[tuple[url_class.ProjectGroup, str, str, str]] = []
         for i in project_groups:
             if i.model is None:
                 if args.verbose:
@@ -155,10 +173,21 @@ def main() -> int:
                     print("Skipping a project with missing namespace/repo.")
                 continue
 
-            size = get_model_size(namespace, repo, rev)
-            filename = get_model_README(namespace, repo, rev)
-            license_value = get_model_license(namespace, repo, rev)
-
+            jobs.append((i, namespace, repo, rev))
+
+        # Hugging Face lookups are network bound and independent, so fetch them for
+        # every project at once. All fetches finish (and the pool's threads exit)
+        # before any metric process is forked, so no child inherits a lock held by
+        # an in-flight request.
+        with ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS) as executor:
+            futures = [
+                executor.submit(get_model_metrics, namespace, repo, rev, session=_SESSION)
+                for _, namespace, repo, rev in jobs
+            ]
+            results = [future.result() for future in futures]
+
+        # Metrics still run per project in input order
+        for (i, namespace, repo, rev), (size, filename, license_value) in zip(jobs, results):
             # Safely build github_str
             github_str = ""
             code_obj = getattr(i, "code", None)
@@ -188,8 +217,8 @@ def main() -> int:
             }
 
             # Run all metrics defined in tasks.txt using the available functions
-            scores, latency = metric_caller.run_concurrently_from_file(
-                "./tasks.txt", input_dict, x, resolved_log_file_path
+            scores, latency = metric_caller.run_concurrently(
+                tasks, input_dict, x, resolved_log_file_path
             )
             build_model_output(f"{repo}", "model", scores, latency)
     
@@ -1,10 +1,28 @@
-import requests
+import httpx
+import orjson
 import configparser
+import os
+import threading
 import typing
 from typing import TextIO
 from typing import Optional
 
 
+_shared_session: Optional[httpx.Client] = None
+_shared_session_pid: Optional[int] = None
+_shared_session_lock = threading.Lock()
+
+def _get_shared_session() -> httpx.Client:
+    """Creates the fallback client on first use in this process and reuses it for every later Api."""
+    global _shared_session, _shared_session_pid
+    with _shared_session_lock:
+        # A client inherited through fork shares the parent's sockets, so each process gets its own
+        if _shared_session is None or _shared_session_pid != os.getpid():
+            _shared_session = httpx.Client(http2=True, follow_redirects=True)
+            _shared_session_pid = os.getpid()
+        return _shared_session
+
+
 class Api :
     """
     A simple API client for making GET requests to a specified base URL.
@@ -17,6 +35,7 @@ class Api :
     -----------
         base_url (str): The base URL for the API.
         bearer_token (str | None): Optional bearer token for authentication.
+        session (httpx.Client): HTTP/2 client reused by every request so connections are pooled and multiplexed. Defaults to one client shared by every Api in the process.
 
     Methods
     -------
@@ -29,17 +48,20 @@ class Api :
     build_url(endpoint:str)
         Constructs a full URL by combining the base URL with the specified endpoint.
     get(endpoint:str, payload:Optional[dict[str, typing.Any]])
-        Sends a GET request to the specified endpoint with optional query parameters. Returns the response as JSON if possible, otherwise as text.
+        Sends a GET request to the specified endpoint with optional query parameters. Returns the response as JSON (decoded with orjson) if possible, otherwise as text.
+    get_conditional(endpoint:str, etag:Optional[str])
+        Sends a GET request with If-None-Match set to etag. Returns (None, etag) on 304 Not Modified, otherwise the response text and its ETag.
     post(endpoint:str, payload:dict[str, str])
-        Sends a POST request to the specified endpoint with a JSON payload. Returns the response as JSON.
+        Sends a POST request to the specified endpoint with a JSON payload (encoded with orjson). Returns the response as JSON.
 
     """
 
     _TIMEOUT : float = 15.0
 
-    def __init__(self, _base_url: str) :
+    def __init__(self, _base_url: str, session: Optional[httpx.Client] = None) :
         self.base_url = _base_url
         self.__bearer_token: Optional[str] = None
+        self.session: httpx.Client = session if session is not None else _get_shared_session()
 
     @property
     def bearer_token(self) ->  Optional[str] :
@@ -77,7 +99,7 @@ class Api :
         if self.__bearer_token:
             headers["Authorization"] = f"Bearer {self.__bearer_token}"
 
-        resp: requests.Response = requests.get(
+        resp: httpx.Response = self.session.get(
             url=url,
             params=payload,
             headers=headers,
@@ -89,22 +111,46 @@ class Api :
             raise Exception(f"GET request failed with status code {status_code} from {url}: {resp.text}")
 
         try:
-            return resp.json()
-        except requests.exceptions.JSONDecodeError:
+            return orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
             return resp.text
 
+    def get_conditional(self, endpoint: str = "", etag: Optional[str] = None) -> tuple[Optional[str], Optional[str]] :
+        url : str = self.build_url(endpoint)
+
+        headers: dict[str, str] = {}
+        if self.__bearer_token:
+            headers["Authorization"] = f"Bearer {self.__bearer_token}"
+        if etag:
+            headers["If-None-Match"] = etag
+
+        resp: httpx.Response = self.session.get(
+            url=url,
+            headers=headers,
+            follow_redirects=True,
+            timeout=self._TIMEOUT
+        )
+
+        status_code: int = resp.status_code
+        if status_code == 304 :
+            return None, etag
+        if status_code != 200 :
+            raise Exception(f"GET request failed with status code {status_code} from {url}: {resp.text}")
+
+        return resp.text, resp.headers.get("ETag")
+
     def post(self, endpoint: str = "", payload: dict[str, str] = {}) -> dict[str, str] :
         url : str = self.build_url(endpoint)
         
         # <-- YOU WERE MISSING THIS SECTION IN post()
-        headers: dict[str, str] = {}
+        headers: dict[str, str] = {"Content-Type": "application/json"}
         if self.__bearer_token:
             headers["Authorization"] = f"Bearer {self.__bearer_token}"
         # -->
 
-        resp: requests.Response = requests.post(
+        resp: httpx.Response = self.session.post(
             url=url,
-            json=payload,
+            content=orjson.dumps(payload),
             headers=headers, # <-- AND YOU WERE MISSING THIS ARGUMENT
             timeout=self._TIMEOUT
         )
@@ -113,7 +159,7 @@ class Api :
         if status_code != 200 :
             raise Exception(f"POST request failed with status code {status_code}: {resp.text}")
 
-        return resp.json()
+        return orjson.loads(resp.content)
 
 
 
@@ -1,6 +1,6 @@
 from .api import Api
 import typing
-import requests
+import httpx
 from os import getenv
 from typing import Optional, Dict
 
@@ -24,9 +24,9 @@ class GitHubApi(Api) :
 
     Methods:
     --------
-    __init__(owner, _repo, _rev="main", env_var=None):
-        Initializes the GitHubApi instance with repository details.
-    verify_token(github_token):
+    __init__(owner, _repo, _rev="main", env_var=None, session=None):
+        Initializes the GitHubApi instance with repository details, optionally reusing a shared session.
+    verify_token(github_token, session=None):
         Verifies the provided GitHub token by making an authenticated request.
     build_endpoint(endpoint, path="", filename=""):
         Constructs the API endpoint URL with provided parameters.
@@ -52,15 +52,15 @@ class GitHubApi(Api) :
     repo: str
     rev: str
 
-    def __init__(self, owner: str, _repo: str, _rev: str = "main", env_var: Optional[str] = None):
-        super().__init__(self.BASE_URL)
+    def __init__(self, owner: str, _repo: str, _rev: str = "main", env_var: Optional[str] = None, session: Optional[httpx.Client] = None):
+        super().__init__(self.BASE_URL, session=session)
         self.owner = owner
         self.repo = _repo
         self.rev = _rev
             
 
     @staticmethod
-    def verify_token(github_token: Optional[str]) -> None:
+    def verify_token(github_token: Optional[str], session: Optional[httpx.Client] = None) -> None:
         # endpoint:str = GitHubApi.ENDPOINT['verify_token']
         # url:str = GitHubApi.BASE_URL + endpoint
         if github_token is None:
@@ -69,9 +69,10 @@ class GitHubApi(Api) :
         url: str = GitHubApi.BASE_URL + GitHubApi.ENDPOINT["verify_token"]
         headers: Dict[str, typing.Any] = {"Authorization": f"token {github_token}"}
 
+        http = session if session is not None else httpx
         try:
-            resp: requests.Response = requests.get(url=url, headers=headers, timeout=Api._TIMEOUT)
-        except requests.RequestException as e:
+            resp: httpx.Response = http.get(url=url, headers=headers, timeout=Api._TIMEOUT)
+        except httpx.HTTPError as e:
             raise RuntimeError(f"GitHub token check failed: {e}") from e
 
         if resp.status_code == 401:
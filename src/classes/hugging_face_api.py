@@ -1,7 +1,8 @@
 from .api import Api
 import typing
-import requests
+import httpx
 import os
+import re
 import tempfile
 from typing import Optional
 from typing import Union
@@ -16,6 +17,7 @@ class HuggingFaceApi(Api) :
     ----------
     BASE_URL (str): The base URL for the Hugging Face API.
     ENDPOINT (Dict[str, str]): Dictionary mapping endpoint names to their URL templates.
+    CACHE_DIR (str): Default directory for cached file downloads.
 
     Attributes:
     ----------
@@ -25,18 +27,22 @@ class HuggingFaceApi(Api) :
     
     Methods:
     --------
-    __init__(_namespace: str, _repo: str, _rev: str = "main"):
-        Initializes the HuggingFaceApi instance with the given namespace, repo, and revision.
+    __init__(_namespace: str, _repo: str, _rev: str = "main", session: Optional[httpx.Client] = None):
+        Initializes the HuggingFaceApi instance with the given namespace, repo, and revision, optionally reusing a shared session.
     set_bearer_token_from_file(filepath: str, section: str = "huggingface", key: str = "bearer_token"):
         Loads the bearer token from a configuration file for authentication.
     validate_model_fields() -> bool:
         Validates that the namespace, repo, and rev fields are set.
     build_endpoint(endpoint: str, path: str = "", filename: str = "") -> str:
         Constructs the API endpoint URL using the provided parameters.
-    get_base_info(endpoint: str) -> dict[str, Any]:
+    get_base_info(endpoint: str, payload: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         Retrieves base information from the specified endpoint.
     get_model_info(endpoint: str = "model_info") -> dict[str, Any]:
         Fetches metadata about the specified model repository.
+    get_model_info_with_sizes(endpoint: str = "model_revision_info") -> dict[str, Any]:
+        Fetches metadata about the model at the current revision, including the size of every file in "siblings".
+    get_model_tags(endpoint: str = "model_info") -> list[str]:
+        Fetches only the tags of the specified model repository.
     get_dataset_info(endpoint: str = "dataset_info") -> dict[str, Any]:
         Fetches metadata about the specified dataset repository.
     get_files_info(endpoint: str, path: str = "") -> list[dict[str, Any]]:
@@ -47,6 +53,8 @@ class HuggingFaceApi(Api) :
         Lists files in the dataset repository.
     download_file(endpoint: str, filename: Union[str, list[str]], dest_dir: str = "tmp") -> Union[str, list[str]]:
         Downloads a file or list of files from the specified endpoint to the destination directory.
+    download_file_cached(endpoint: str, filename: str, cache_dir: Optional[str] = None) -> str:
+        Downloads a file into an on-disk cache keyed by namespace, repo and revision, revalidating a cached copy with its ETag in one conditional GET.
     download_model_file(filename: Union[str, list[str]], dest_dir: str = "tmp", endpoint: str = "model_file_download") -> Union[str, list[str]]:
         Downloads a model file or files from the model repository.
     download_dataset_file(filename: Union[str, list[str]], dest_dir: str = "tmp", endpoint: str = "dataset_file_download") -> Union[str, list[str]]:
@@ -56,20 +64,23 @@ class HuggingFaceApi(Api) :
     BASE_URL: str = "https://huggingface.co"
     ENDPOINT: typing.Dict[str, str] = {
         "model_info": "api/models/{namespace}/{repo}",
+        "model_revision_info": "api/models/{namespace}/{repo}/revision/{rev}",
         "model_files": "api/models/{namespace}/{repo}/tree/{rev}/{path}",
         "model_file_download": "{namespace}/{repo}/resolve/{rev}/{filename}",
+        "model_file_raw": "{namespace}/{repo}/raw/{rev}/{filename}",
         "dataset_info": "api/dataset/{namespace}/{repo}",
         "dataset_files": "api/dataset/{namespace}/{repo}/tree/{rev}/{path}",
         "dataset_file_download": "{namespace}/{repo}/resolve/{rev}/{filename}",
         # Add more endpoints as needed
     }
+    CACHE_DIR: str = os.path.join(os.path.expanduser("~"), ".cache", "ece30861")
 
     namespace: str
     repo: str
     rev: str
 
-    def __init__(self, _namespace: str, _repo: str, _rev: str = "main"):
-        super().__init__(self.BASE_URL)
+    def __init__(self, _namespace: str, _repo: str, _rev: str = "main", session: Optional[httpx.Client] = None):
+        super().__init__(self.BASE_URL, session=session)
         self.namespace = _namespace
         self.repo = _repo
         self.rev = _rev
@@ -92,17 +103,31 @@ class HuggingFaceApi(Api) :
         api_endpoint: str = endpoint_temp.format(namespace=self.namespace, repo=self.repo, rev=self.rev, path=path, filename=filename)
         return api_endpoint
 
-    def get_base_info(self, endpoint: str) -> dict[str, typing.Any] :
+    def get_base_info(self, endpoint: str, payload: Optional[dict[str, typing.Any]] = None) -> dict[str, typing.Any] :
         # self.validate_model_fields()
         
         api_endpoint: str = self.build_endpoint(endpoint)
-        return self.get(api_endpoint)
+        return self.get(api_endpoint, payload=payload)
 
     def get_model_info(self, endpoint: str = "model_info") -> dict[str, typing.Any] :
         self.validate_model_fields()
         
         return self.get_base_info(endpoint)
     
+    def get_model_info_with_sizes(self, endpoint: str = "model_revision_info") -> dict[str, typing.Any] :
+        self.validate_model_fields()
+
+        # blobs=true adds a "size" to every entry in "siblings", so no separate file listing is needed
+        return self.get_base_info(endpoint, payload={"blobs": "true"})
+
+    def get_model_tags(self, endpoint: str = "model_info") -> list[str] :
+        self.validate_model_fields()
+
+        # Ask the API to expand only the tags rather than the whole model info payload
+        info: dict[str, typing.Any] = self.get_base_info(endpoint, payload={"expand": ["tags"]})
+        tags = info.get("tags") if isinstance(info, dict) else None
+        return tags if isinstance(tags, list) else []
+
     def get_dataset_info(self, endpoint: str = "dataset_info") -> dict[str, typing.Any] :
         
         return self.get_base_info(endpoint)
@@ -143,7 +168,7 @@ class HuggingFaceApi(Api) :
                 api_endpoint = self.build_endpoint(endpoint, filename=fname)
                 content = str(self.get(api_endpoint))
                 fname = fname.replace('/', '_')
-                file_path = os.path.join(dest_dir, f"{self.repo}_{fname}")
+                file_path = os.path.join(dest_dir, f"{self.namespace}_{self.repo}_{fname}")
                 with open(file_path, "wb") as f:
                     f.write(content.encode())
                 file_paths.append(file_path)
@@ -152,11 +177,54 @@ class HuggingFaceApi(Api) :
         api_endpoint = self.build_endpoint(endpoint, filename=filename)
         content = self.get(api_endpoint)
         
-        file_path: str = os.path.join(dest_dir, f"{self.repo}_{filename}.txt")
+        file_path: str = self._local_file_path(dest_dir, filename)
         with open(file_path, "wb") as f:
             f.write(content.encode())
 
         return file_path
+
+    def _local_file_path(self, dest_dir: str, filename: str) -> str:
+        return os.path.join(dest_dir, f"{self.namespace}_{self.repo}_{filename}.txt")
+
+    def download_file_cached(self, endpoint: str, filename: str, cache_dir: Optional[str] = None) -> str:
+        key: str = "_".join((self.namespace, self.repo, self.rev))
+        entry_dir: str = os.path.join(cache_dir or self.CACHE_DIR, re.sub(r"[^A-Za-z0-9._-]", "_", key))
+        cached_path: str = self._local_file_path(entry_dir, filename)
+        etag_path: str = cached_path + ".etag"
+
+        cached_etag: Optional[str] = None
+        if os.path.isfile(cached_path) and os.path.isfile(etag_path):
+            with open(etag_path, "r") as f:
+                cached_etag = f.read().strip() or None
+
+        # One conditional GET: 304 means the cached copy is current, 200 carries the new content
+        api_endpoint: str = self.build_endpoint(endpoint, filename=filename)
+        content, etag = self.get_conditional(api_endpoint, etag=cached_etag)
+        if content is None:
+            os.utime(cached_path)  # Mark as recently used
+            return cached_path
+
+        # The file is replaced before its ETag, so a stale ETag can only force a re-download
+        os.makedirs(entry_dir, exist_ok=True)
+        self._replace_file(cached_path, content)
+        if etag:
+            self._replace_file(etag_path, etag)
+        elif os.path.exists(etag_path):
+            os.remove(etag_path)
+
+        return cached_path
+
+    @staticmethod
+    def _replace_file(path: str, content: str) -> None:
+        # Write next to the target, then move it in place so a partial file is never cached
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content.encode())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
     
     def download_model_file(self, filename: Union[str, list[str]], dest_dir: str = "tmp", endpoint: str = "model_file_download") -> Union[str, list[str]]:
         return self.download_file(endpoint, filename, dest_dir)
@@ -1,7 +1,5 @@
 from .api import Api
-import requests
 import os
-import json
 
 class GenAiChatApi(Api):
     """
@@ -45,16 +43,9 @@ class GenAiChatApi(Api):
         }
 
         try:
-            # Call the parent class's post method
+            # Call the parent class's post method (returns the already-decoded JSON body)
             response_data = self.post(endpoint=self.CHAT_ENDPOINT, payload=payload)
 
-            # If API returned raw JSON text, parse it
-            if isinstance(response_data, str):
-                try:
-                    response_data = json.loads(response_data)
-                except Exception:
-                    return ""  # bad JSON → no content
-
             # Only proceed if we have a dict (mapping)
             if isinstance(response_data, dict):
                 choices = response_data.get("choices")
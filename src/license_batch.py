@@ -0,0 +1,26 @@
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+
+# Kept out of src/metrics so the per-project metric workers don't import numpy/pandas.
+from src.metrics.calculate_license_score import _TIER_PATTERNS, _TIER_RESULT
+
+
+def calculate_license_scores(license_infos: List[Optional[str]]) -> np.ndarray:
+    '''
+    Scores a batch of licenses with the same tiers as calculate_license_score,
+    one vectorized scan per tier. Returns one score per input, in order.
+    '''
+    texts = pd.Series(license_infos, dtype=object)
+    texts = texts.where(texts.map(bool), "unknown").astype(str).str.lower().str.strip()
+
+    # Tier 10: Unknown/No license (0.5) unless a tier matches
+    scores = np.full(len(texts), 0.5)
+    unmatched = np.ones(len(texts), dtype=bool)
+    for name, pattern in _TIER_PATTERNS:
+        score, _ = _TIER_RESULT[name]
+        # The first tier (in priority order) that matches a license decides its score
+        hits = texts.str.contains(pattern).to_numpy(dtype=bool) & unmatched
+        scores[hits] = score
+        unmatched &= ~hits
+    return scores
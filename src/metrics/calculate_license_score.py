@@ -1,8 +1,57 @@
 import os
 import time
-import requests
 import re
-from typing import Tuple
+from typing import List, Optional, Tuple
+
+
+# License tiers in priority order: (group name, substrings, score, log message).
+# The first tier with any of its substrings in the license text decides the score.
+_LICENSE_TIERS = (
+    # Tier 1: Highly Permissive & LGPL-2.1 Compatible (1.0)
+    ("permissive", ("mit", "apache-2.0", "apache2", "apache license 2.0",
+                    "bsd-2-clause", "bsd-3-clause", "bsd-2", "bsd-3", "bsd",
+                    "unlicense", "cc0", "creative commons zero"), 1.0, "Highly permissive license"),
+    # Tier 2: LGPL-2.1 Exact Match (0.9)
+    ("lgpl_2_1", ("lgpl-2.1", "lgplv2.1"), 0.9, "LGPL-2.1 license"),
+    # Tier 3: Other Permissive Licenses (0.8)
+    ("permissive_conditions", ("mpl-2.0", "mpl2", "mozilla public license 2.0",
+                               "eclipse-2.0", "eclipse public license 2.0"), 0.8, "Permissive with conditions"),
+    # Tier 4: LGPL Family (0.7)
+    ("lgpl_family", ("lgpl", "lgpl-", "lesser general public license"), 0.7, "LGPL family license"),
+    # Tier 5: Modern ML Licenses (0.6-0.7)
+    ("openrail", ("openrail",), 0.7, "OpenRAIL license"),
+    ("modern_ml", ("llama2", "gemma", "bigscience", "bigcode"), 0.6, "Modern ML license"),
+    # Tier 6: Weak Copyleft (0.6)
+    ("weak_copyleft", ("lgpl-3.0", "lgplv3", "epl-1.0", "epl-2.0"), 0.6, "Weak copyleft license"),
+    # Tier 7: Strong Copyleft (0.3-0.5)
+    ("gpl_2", ("gpl-2.0", "gplv2"), 0.5, "GPL-2.0 license"),
+    ("strong_copyleft", ("gpl-3.0", "gplv3", "gpl", "agpl", "affero gpl"), 0.3, "Strong copyleft license"),
+    # Tier 8: Restricted/Non-commercial (0.2)
+    ("restricted", ("non-commercial", "noncommercial", "research-only",
+                    "research use", "no-derivatives", "cc-by-nc",
+                    "educational", "academic", "non-profit"), 0.2, "Restricted license"),
+    # Tier 9: Proprietary/Closed (0.0)
+    ("proprietary", ("proprietary", "closed source", "commercial",
+                     "all rights reserved"), 0.0, "Proprietary license"),
+)
+
+_TIER_RESULT = {name: (score, message) for name, _, score, message in _LICENSE_TIERS}
+
+# One precompiled pattern per tier, in priority order. The substrings are all
+# lowercase and the text is lowercased once, so no IGNORECASE is needed (it
+# disables the regex engine's literal-prefix fast scan).
+_TIER_PATTERNS = tuple(
+    (name, re.compile("|".join(re.escape(sub) for sub in subs)))
+    for name, subs, _, _ in _LICENSE_TIERS
+)
+
+
+def _classify_license(license_text: str) -> Optional[str]:
+    """Returns the name of the highest priority tier found in license_text, or None."""
+    for name, pattern in _TIER_PATTERNS:
+        if pattern.search(license_text):
+            return name
+    return None
 
 
 def calculate_license_score(license_info: str, verbosity: int, log_queue) -> Tuple[float, float]:
@@ -11,109 +60,50 @@ def calculate_license_score(license_info: str, verbosity: int, log_queue) -> Tup
     Verbosity is controlled by the passed-in argument (0=silent, 1=INFO, 2=DEBUG).
     '''
     
-    pid = os.getpid()
+    # Only needed to tag log lines, so skip the syscall when logging is off
+    pid = os.getpid() if verbosity >= 1 else 0
+
+    # Log lines are collected and sent as one batch at the end (one queue put per call)
+    msgs: List[str] = []
     
     if verbosity >= 1: # Informational
-        log_queue.put(f"[{pid}] [INFO] Starting license score calculation for {license_info}...")
+        msgs.append(f"[{pid}] [INFO] Starting license score calculation for {license_info}...")
 
-    # latency time
-    start_time = time.time()  
+    # latency time (always measured: it is reported as license_latency even when silent)
+    start_time = time.perf_counter()
 
     try:
         if verbosity >= 1: # Informational
             if license_info:
-                log_queue.put(f"[{pid}] [INFO] License info found: {license_info}")
+                msgs.append(f"[{pid}] [INFO] License info found: {license_info}")
             else:
-                log_queue.put(f"[{pid}] [INFO] No license info found")
+                msgs.append(f"[{pid}] [INFO] No license info found")
 
-        # Convert to lowercase for consistent matching
+        # Convert to lowercase for consistent matching (cardData may hold a list, hence str())
         license_text = str(license_info).lower().strip() if license_info else "unknown"
 
-        # Tier 1: Highly Permissive & LGPL-2.1 Compatible (1.0)
-        permissive_licenses = ["mit", "apache-2.0", "apache2", "apache license 2.0", 
-                              "bsd-2-clause", "bsd-3-clause", "bsd-2", "bsd-3", "bsd",
-                              "unlicense", "cc0", "creative commons zero"]
-        
-        if any(license in license_text for license in permissive_licenses):
-            score = 1.0
-            if verbosity >= 1: # Informational
-                log_queue.put(f"[{pid}] [INFO] Highly permissive license -> Score = 1.0")
-
-        # Tier 2: LGPL-2.1 Exact Match (0.9)
-        elif "lgpl-2.1" in license_text or "lgplv2.1" in license_text:
-            score = 0.9
-            if verbosity >= 1: # Informational
-                log_queue.put(f"[{pid}] [INFO] LGPL-2.1 license -> Score = 0.9")
-
-        # Tier 3: Other Permissive Licenses (0.8)
-        elif any(license in license_text for license in ["mpl-2.0", "mpl2", "mozilla public license 2.0", 
-                                                        "eclipse-2.0", "eclipse public license 2.0"]):
-            score = 0.8
-            if verbosity >= 1: # Informational
-                log_queue.put(f"[{pid}] [INFO] Permissive with conditions -> Score = 0.8")
-
-        # Tier 4: LGPL Family (0.7)
-        elif any(license in license_text for license in ["lgpl", "lgpl-", "lesser general public license"]):
-            score = 0.7
-            if verbosity >= 1: # Informational
-                log_queue.put(f"[{pid}] [INFO] LGPL family license -> Score = 0.7")
-
-        # Tier 5: Modern ML Licenses (0.6-0.7)
-        elif "openrail" in license_text:
-            score = 0.7
-            if verbosity >= 1: # Informational
-                log_queue.put(f"[{pid}] [INFO] OpenRAIL license -> Score = 0.7")
-        elif any(license in license_text for license in ["llama2", "gemma", "bigscience", "bigcode"]):
-            score = 0.6
-            if verbosity >= 1: # Informational
-                log_queue.put(f"[{pid}] [INFO] Modern ML license -> Score = 0.6")
-
-        # Tier 6: Weak Copyleft (0.6)
-        elif any(license in license_text for license in ["lgpl-3.0", "lgplv3", "epl-1.0", "epl-2.0"]):
-            score = 0.6
-            if verbosity >= 1: # Informational
-                log_queue.put(f"[{pid}] [INFO] Weak copyleft license -> Score = 0.6")
-
-        # Tier 7: Strong Copyleft (0.3-0.5)
-        elif any(license in license_text for license in ["gpl-2.0", "gplv2"]):
-            score = 0.5
-            if verbosity >= 1: # Informational
-                log_queue.put(f"[{pid}] [INFO] GPL-2.0 license -> Score = 0.5")
-        elif any(license in license_text for license in ["gpl-3.0", "gplv3", "gpl", "agpl", "affero gpl"]):
-            score = 0.3
-            if verbosity >= 1: # Informational
-                log_queue.put(f"[{pid}] [INFO] Strong copyleft license -> Score = 0.3")
-
-        # Tier 8: Restricted/Non-commercial (0.2)
-        elif any(license in license_text for license in ["non-commercial", "noncommercial", "research-only", 
-                                                        "research use", "no-derivatives", "cc-by-nc",
-                                                        "educational", "academic", "non-profit"]):
-            score = 0.2
-            if verbosity >= 1: # Informational
-                log_queue.put(f"[{pid}] [INFO] Restricted license -> Score = 0.2")
-
-        # Tier 9: Proprietary/Closed (0.0)
-        elif any(license in license_text for license in ["proprietary", "closed source", "commercial", 
-                                                        "all rights reserved"]):
-            score = 0.0
-            if verbosity >= 1: # Informational
-                log_queue.put(f"[{pid}] [INFO] Proprietary license -> Score = 0.0")
-
-        # Tier 10: Unknown/No license (0.5)
+        tier = _classify_license(license_text)
+        if tier is not None:
+            score, message = _TIER_RESULT[tier]
         else:
-            score = 0.5
-            if verbosity >= 1: # Informational
-                log_queue.put(f"[{pid}] [INFO] Unknown license -> Score = 0.5")
+            # Tier 10: Unknown/No license (0.5)
+            score, message = 0.5, "Unknown license"
+
+        if verbosity >= 1: # Informational
+            msgs.append(f"[{pid}] [INFO] {message} -> Score = {score}")
 
     except Exception as e:
         if verbosity >= 1: # Informational
-            log_queue.put(f"[{pid}] [CRITICAL ERROR] calculating license score for '{license_info}': {e}")
+            msgs.append(f"[{pid}] [CRITICAL ERROR] calculating license score for '{license_info}': {e}")
         score = 0.5  # More conservative default for errors
     
     # end latency timer 
-    time_taken = time.time() - start_time 
+    time_taken = time.perf_counter() - start_time
     if verbosity >= 1: # Informational
-        log_queue.put(f"[{pid}] [INFO] Finished calculation. Score={score:.2f}, Time={time_taken:.3f}s")
+        msgs.append(f"[{pid}] [INFO] Finished calculation. Score={score:.2f}, Time={time_taken:.3f}s")
+
+    if msgs:
+        log_queue.put(msgs)
 
     return score, time_taken
 
@@ -1,21 +1,21 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Tuple
-from urllib.parse import urlparse
 
-@dataclass
+@dataclass(slots=True)
 class Code:
     link: str
     namespace: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class Dataset:
     link: str
     namespace: str = ""
     repo: str = ""
     rev: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class Model:
     # www.huggingface.co\namespace\repo\rev
     link: str 
@@ -23,12 +23,31 @@ class Model:
     repo: str = ""
     rev: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class ProjectGroup:
     code: Optional[Code] = None
     dataset: Optional[Dataset] = None
     model: Optional[Model] = None
 
+def _is_url_scheme(scheme: str) -> bool:
+    return (scheme[:1].isalpha() and scheme.isascii()
+            and all(c.isalnum() or c in "+-." for c in scheme))
+
+def _split_url(url: str) -> Tuple[str, str]:
+    """
+    Split a URL into (netloc, path), dropping any query string or fragment.
+
+    A lightweight stand-in for `urlparse` for the simple link shapes in URL files.
+    As with `urlparse`, a URL without a `scheme://` prefix is treated as a bare path.
+    """
+    url = url.partition("#")[0].partition("?")[0]
+    scheme, sep, rest = url.partition("://")
+    if not sep or not _is_url_scheme(scheme):
+        return "", url
+    netloc, slash, path = rest.partition("/")
+    return netloc, slash + path
+
+@lru_cache(maxsize=4096)
 def parse_huggingface_url(url: str) -> Tuple[str, str, str]:
     """
     Parse a Hugging Face model URL and return (namespace, repo, rev).
@@ -37,9 +56,11 @@ def parse_huggingface_url(url: str) -> Tuple[str, str, str]:
 
     If the URL is missing a namespace or repo part, this function returns empty string.
     The revision defaults to "main" unless a `/tree/<rev>` segment is present.
+
+    Results are cached, since the same model URL often repeats across URL files.
     """
-    parsed = urlparse(url)
-    parts = parsed.path.strip("/").split("/")
+    _, path = _split_url(url)
+    parts = path.strip("/").split("/")
 
     # Require at least namespace and repo. Return empty strings if not present
     if len(parts) < 2:
@@ -52,6 +73,7 @@ def parse_huggingface_url(url: str) -> Tuple[str, str, str]:
         rev = parts[3]
     return namespace, repo, rev
 
+@lru_cache(maxsize=4096)
 def parse_dataset_url(url: str) -> str:
     """
     Parse a dataset URL and return the appropriate identifier for loading.
@@ -67,12 +89,14 @@ def parse_dataset_url(url: str) -> str:
     
     Raises:
         ValueError: if the URL is not recognized.
+
+    Successful results are cached; unsupported URLs raise again on every call.
     """
-    parsed = urlparse(url)
+    netloc, path = _split_url(url)
 
     # Case: Hugging Face dataset
-    if "huggingface.co" in parsed.netloc:
-        parts = parsed.path.strip("/").split("/")
+    if "huggingface.co" in netloc:
+        parts = path.strip("/").split("/")
         # Expect `datasets/<...>`, but could be different
         if parts:
             # If the first segment is 'datasets', use the last part as the repo name
@@ -84,7 +108,7 @@ def parse_dataset_url(url: str) -> str:
         return ""
 
     # Case: GitHub dataset
-    if "github.com" in parsed.netloc:
+    if "github.com" in netloc:
         return url  # keep full URL for git clone
 
     # Case: Unknown host
@@ -110,16 +134,19 @@ def parse_project_file(filepath: str) -> List[ProjectGroup]:
 
     # Read the project file line by line. Each line is comma-separated:
     # code_link,dataset_link,model_link. Missing entries are treated as empty.
-    with path.open("r", encoding="ASCII") as f:
+    # A large read buffer keeps big URL files to a handful of read() calls
+    with path.open("r", encoding="ASCII", buffering=1 << 20) as f:
         for raw_line in f:
             line = raw_line.strip()
             if not line:  # skip empty lines
                 continue
-            # Split into up to three parts and pad with empty strings
-            parts = [p.strip() for p in line.split(",")]
-            while len(parts) < 3:
-                parts.append("")
-            code_link, dataset_link, model_link = parts
+            # Split off up to three fields; missing fields come back as ""
+            code_link, _, rest = line.partition(",")
+            dataset_link, _, rest = rest.partition(",")
+            model_link = rest.partition(",")[0]
+            code_link = code_link.strip()
+            dataset_link = dataset_link.strip()
+            model_link = model_link.strip()
 
             code: Optional[Code] = None
             dataset: Optional[Dataset] = None
@@ -0,0 +1,84 @@
+import unittest
+from src.metrics.calculate_license_score import calculate_license_score
+from src.license_batch import calculate_license_scores
+
+
+class DummyQueue:
+    def __init__(self):
+        self.items = []
+
+    def put(self, msg):
+        self.items.append(msg)
+
+
+class TestCalculateLicenseScore(unittest.TestCase):
+
+    def score(self, license_info):
+        score, _ = calculate_license_score(license_info, 0, DummyQueue())
+        return score
+
+    # ---------------- tiers ----------------
+    def test_known_licenses(self):
+        self.assertEqual(self.score("MIT"), 1.0)
+        self.assertEqual(self.score("Apache-2.0"), 1.0)
+        self.assertEqual(self.score("LGPL-2.1"), 0.9)
+        self.assertEqual(self.score("mpl-2.0"), 0.8)
+        self.assertEqual(self.score("LGPL-3.0"), 0.7)
+        self.assertEqual(self.score("OpenRAIL"), 0.7)
+        self.assertEqual(self.score("Llama2"), 0.6)
+        self.assertEqual(self.score("gpl-2.0"), 0.5)
+        self.assertEqual(self.score("GPL-3.0"), 0.3)
+        self.assertEqual(self.score("Non-commercial"), 0.2)
+        self.assertEqual(self.score("Proprietary"), 0.0)
+
+    def test_unknown_or_missing_license(self):
+        self.assertEqual(self.score("Unknown License"), 0.5)
+        self.assertEqual(self.score(""), 0.5)
+        self.assertEqual(self.score(None), 0.5)
+
+    def test_higher_tier_wins_regardless_of_position(self):
+        # "commercial" (0.0) appears first, but "mit" (1.0) is a better tier
+        self.assertEqual(self.score("commercial use permitted"), 1.0)
+        # "lgpl" is matched by the LGPL family before the GPL tiers
+        self.assertEqual(self.score("gpl-3.0 or lgpl"), 0.7)
+
+    def test_latency_measured_when_silent(self):
+        _, time_taken = calculate_license_score("MIT", 0, DummyQueue())
+        self.assertIsInstance(time_taken, float)
+        self.assertGreater(time_taken, 0.0)
+
+    # ---------------- logging ----------------
+    def test_silent_mode_logs_nothing(self):
+        q = DummyQueue()
+        calculate_license_score("MIT", 0, q)
+        self.assertEqual(q.items, [])
+
+    def test_verbose_mode_logs_tier(self):
+        q = DummyQueue()
+        calculate_license_score("MIT", 1, q)
+        self.assertTrue(any("Highly permissive license -> Score = 1.0" in m for m in q.items[0]))
+
+    def test_verbose_mode_sends_one_batch(self):
+        q = DummyQueue()
+        calculate_license_score("MIT", 1, q)
+        self.assertEqual(len(q.items), 1)
+        self.assertIsInstance(q.items[0], list)
+
+
+class TestCalculateLicenseScores(unittest.TestCase):
+
+    def test_batch_matches_single(self):
+        licenses = ["MIT", "LGPL-2.1", "gpl-3.0 or lgpl", "commercial use permitted",
+                    "Proprietary", "Unknown License", "", None]
+        expected = [calculate_license_score(lic, 0, DummyQueue())[0] for lic in licenses]
+        self.assertEqual(list(calculate_license_scores(licenses)), expected)
+
+    def test_batch_without_any_match(self):
+        self.assertEqual(list(calculate_license_scores(["unknown", None])), [0.5, 0.5])
+
+    def test_batch_empty(self):
+        self.assertEqual(len(calculate_license_scores([])), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
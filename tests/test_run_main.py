@@ -4,6 +4,7 @@ import run
 import src.url_class as url_class
 import tempfile
 import multiprocessing
+import threading
 import os
 import sys
 from pathlib import Path
@@ -81,6 +82,22 @@ class TestSampleClean(unittest.TestCase):
         finally:
             os.remove(log_file)
 
+    def test_logger_writes_batched_messages(self):
+        q = multiprocessing.Queue()
+        with tempfile.NamedTemporaryFile(delete=False) as tf:
+            log_file = tf.name
+        try:
+            p = multiprocessing.Process(target=mc.logger_process, args=(q, log_file))
+            p.start()
+            q.put(["first", "second"])
+            q.put(None)
+            p.join()
+            with open(log_file) as f:
+                content = f.read()
+            self.assertEqual(content, "first\nsecond\n")
+        finally:
+            os.remove(log_file)
+
     def test_logger_process_handles_exception(self):
         q = multiprocessing.Queue()
         p = multiprocessing.Process(target=mc.logger_process, args=(q, "/invalid/path/log.txt"))
@@ -140,6 +157,32 @@ class TestSampleClean(unittest.TestCase):
             scores, times = mc.run_concurrently_from_file(tasks_file, all_args, tmpdir, os.path.join(tmpdir,"log.txt"))
             self.assertEqual(scores['net_score'], 0.0)
 
+    def test_load_tasks_parses_valid_lines(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tasks_file = os.path.join(tmpdir, "tasks.txt")
+            with open(tasks_file, "w") as f:
+                f.write("metric_a(x, verbosity, log_queue) 3\n")
+                f.write("\n")
+                f.write("invalid_line_without_proper_syntax\n")
+                f.write("metric_b() 0.5\n")
+            tasks = mc.load_tasks(tasks_file)
+        self.assertEqual(tasks, [
+            ("metric_a", ["x", "verbosity", "log_queue"], 3.0),
+            ("metric_b", [], 0.5),
+        ])
+
+    def test_run_concurrently_reuses_parsed_tasks(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "add.py"), "w") as f:
+                f.write("def add(a, b):\n    return a + b, 0.0\n")
+            funcs = mc.load_available_functions(tmpdir)
+            tasks = [("add", ["a", "b"], 1.0)]
+            log_file = os.path.join(tmpdir, "log.txt")
+            first, _ = mc.run_concurrently(tasks, {"verbosity": 0, "a": 0.25, "b": 0.25}, funcs, log_file)
+            second, _ = mc.run_concurrently(tasks, {"verbosity": 0, "a": 0.5, "b": 0.5}, funcs, log_file)
+        self.assertEqual(first["add"], 0.5)
+        self.assertEqual(second["add"], 1.0)
+
     # ---------------- build_model_output ----------------
     def test_build_model_output_basic(self):
         scores = {
@@ -202,6 +245,12 @@ class TestURLClass(unittest.TestCase):
         self.assertEqual(d.repo, "repo2")
         self.assertEqual(m.rev, "rev3")
 
+    def test_dataclasses_use_slots(self):
+        m = Model("link", "ns", "repo", "main")
+        self.assertFalse(hasattr(m, "__dict__"))
+        with self.assertRaises(AttributeError):
+            m.extra = "value"
+
     def test_project_group_optional(self):
         pg = ProjectGroup(code=None, dataset=None, model=None)
         self.assertIsNone(pg.code)
@@ -219,6 +268,46 @@ class TestURLClass(unittest.TestCase):
         ns, repo, rev = url_class.parse_huggingface_url("https://huggingface.co/ns/repo/tree/dev")
         self.assertEqual(rev, "dev")
 
+    def test_parse_huggingface_url_ignores_query_and_fragment(self):
+        ns, repo, rev = url_class.parse_huggingface_url("https://huggingface.co/ns/repo/tree/dev?x=1#readme")
+        self.assertEqual((ns, repo, rev), ("ns", "repo", "dev"))
+
+    def test_parse_huggingface_url_missing_repo(self):
+        self.assertEqual(url_class.parse_huggingface_url("https://huggingface.co/ns"), ("", "", ""))
+
+    def test_parse_dataset_url_github_and_unknown_host(self):
+        url = "https://github.com/zalandoresearch/fashion-mnist"
+        self.assertEqual(url_class.parse_dataset_url(url), url)
+        with self.assertRaises(ValueError):
+            url_class.parse_dataset_url("https://example.com/data")
+
+    def test_parse_huggingface_url_is_cached(self):
+        url_class.parse_huggingface_url.cache_clear()
+        url_class.parse_huggingface_url("https://huggingface.co/ns/repo")
+        url_class.parse_huggingface_url("https://huggingface.co/ns/repo")
+        self.assertEqual(url_class.parse_huggingface_url.cache_info().hits, 1)
+
+    # ---------------- parse_project_file ----------------
+    def test_parse_project_file_missing_fields(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            url_file = os.path.join(tmpdir, "urls.txt")
+            with open(url_file, "w") as f:
+                f.write(",,https://huggingface.co/ns/repo\n")
+                f.write("https://github.com/owner/code\n")
+                f.write("\n")
+                f.write(" https://github.com/owner/code , https://huggingface.co/datasets/imdb , https://huggingface.co/ns/repo/tree/dev\n")
+            groups = url_class.parse_project_file(url_file)
+
+        self.assertEqual(len(groups), 3)
+        self.assertIsNone(groups[0].code)
+        self.assertIsNone(groups[0].dataset)
+        self.assertEqual(groups[0].model.repo, "repo")
+        self.assertEqual(groups[1].code.link, "https://github.com/owner/code")
+        self.assertIsNone(groups[1].model)
+        self.assertEqual(groups[2].code.link, "https://github.com/owner/code")
+        self.assertEqual(groups[2].dataset.repo, "imdb")
+        self.assertEqual(groups[2].model.rev, "dev")
+
     # ---------------- parse_hf_dataset_url_repo ----------------
     def test_parse_hf_dataset_url_repo_valid(self):
         url = "https://huggingface.co/datasets/stanfordnlp/imdb"
@@ -304,9 +393,123 @@ class TestMetricCallerExtraBranches(unittest.TestCase):
 import unittest
 from unittest.mock import patch, MagicMock
 import run
+import get_model_metrics as gmm
+
+class TestGetModelMetrics(unittest.TestCase):
+
+    def test_license_from_tags(self):
+        self.assertEqual(gmm._get_license_from_tags(["pytorch", "license:mit"]), "mit")
+        self.assertEqual(gmm._get_license_from_tags(["licence:apache-2.0"]), "apache-2.0")
+        self.assertIsNone(gmm._get_license_from_tags(["pytorch", 3]))
+
+    @patch("get_model_metrics.HuggingFaceApi")
+    def test_get_model_metrics_uses_one_client(self, mock_api_class):
+        api = mock_api_class.return_value
+        api.get_model_info_with_sizes.return_value = {
+            "siblings": [{"size": 10}, {"size": None}, {"size": 5}],
+            "tags": ["license:mit"],
+        }
+        api.download_file_cached.return_value = "tmp/ns_repo_README.md.txt"
+
+        size, readme, license_value = gmm.get_model_metrics("ns", "repo", "main")
+
+        mock_api_class.assert_called_once()
+        api.get_model_info_with_sizes.assert_called_once()
+        api.get_model_files_info.assert_not_called()
+        api.get_model_tags.assert_not_called()
+        self.assertEqual(size, 15.0)
+        self.assertEqual(readme, "tmp/ns_repo_README.md.txt")
+        self.assertEqual(license_value, "mit")
+
+    @patch("get_model_metrics.HuggingFaceApi")
+    def test_get_model_metrics_license_falls_back_to_readme(self, mock_api_class):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            readme_path = os.path.join(tmpdir, "README.md.txt")
+            with open(readme_path, "w") as f:
+                f.write("# Model\n## License\nApache-2.0\n")
+            api = mock_api_class.return_value
+            api.get_model_info_with_sizes.side_effect = Exception("offline")
+            api.download_file_cached.return_value = readme_path
+
+            size, readme, license_value = gmm.get_model_metrics("ns", "repo", "main")
+
+        self.assertEqual(size, 0.0)
+        self.assertEqual(license_value, "Apache-2.0")
+
+class TestHuggingFaceReadmeCache(unittest.TestCase):
+
+    def setUp(self):
+        import httpx
+        from src.classes.hugging_face_api import HuggingFaceApi
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.etag = '"abc123"'
+        self.body = "# README"
+        self.requests = []
+
+        def handler(request):
+            # Minimal Hugging Face stand-in that honors If-None-Match
+            self.requests.append(request)
+            if request.headers.get("If-None-Match") == self.etag:
+                return httpx.Response(304)
+            return httpx.Response(200, text=self.body, headers={"ETag": self.etag})
+
+        session = httpx.Client(transport=httpx.MockTransport(handler))
+        self.addCleanup(session.close)
+        self.api = HuggingFaceApi("ns", "repo", "main", session=session)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def download(self):
+        return self.api.download_file_cached("model_file_download", "README.md", self.tmpdir.name)
+
+    def test_second_download_hits_cache(self):
+        first = self.download()
+        second = self.download()
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.requests), 2)
+        self.assertNotIn("If-None-Match", self.requests[0].headers)
+        self.assertEqual(self.requests[1].headers["If-None-Match"], '"abc123"')
+        with open(first) as f:
+            self.assertEqual(f.read(), "# README")
+
+    def test_changed_etag_downloads_again(self):
+        self.download()
+        self.etag, self.body = '"def456"', "# README v2"
+        path = self.download()
+
+        with open(path) as f:
+            self.assertEqual(f.read(), "# README v2")
+        with open(path + ".etag") as f:
+            self.assertEqual(f.read(), '"def456"')
+
+class TestApiSharedSession(unittest.TestCase):
+
+    def test_apis_without_session_share_one_client(self):
+        from src.classes.api import Api
+        first, second = Api("https://example.com"), Api("https://example.org")
+        self.assertIs(first.session, second.session)
+
+    def test_forked_process_gets_its_own_client(self):
+        from src.classes import api
+        parent_session = api.Api("https://example.com").session
+        with patch("src.classes.api.os.getpid", return_value=-1):
+            self.assertIsNot(api.Api("https://example.com").session, parent_session)
 
 class TestRunExtraBranches(unittest.TestCase):
 
+    def test_validate_log_file_path_creates_dir_and_caches(self):
+        run.validate_log_file_path.cache_clear()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = os.path.join(tmpdir, "logs", "log.txt")
+            self.assertTrue(run.validate_log_file_path(log_path))
+            self.assertTrue(os.path.isdir(os.path.join(tmpdir, "logs")))
+            with patch("run.os.makedirs") as mock_makedirs:
+                self.assertTrue(run.validate_log_file_path(log_path))
+                mock_makedirs.assert_not_called()
+        self.assertFalse(run.validate_log_file_path(""))
+
     @patch("subprocess.check_call")
     @patch("sys.argv", ["run.py", "install"])
     def test_install_branch(self, mock_subproc):
@@ -321,15 +524,15 @@ class TestRunExtraBranches(unittest.TestCase):
         mock_print.assert_any_call("Running test suite...")
 
     @patch("run.url_class.parse_project_file")
-    @patch("run.get_model_size", return_value=1234)
-    @patch("run.get_model_README", return_value="README.md")
-    @patch("run.metric_caller.run_concurrently_from_file", return_value=({}, {}))
+    @patch("run.get_model_metrics", return_value=(1234, "README.md", "mit"))
+    @patch("run.metric_caller.load_tasks", return_value=[])
+    @patch("run.metric_caller.run_concurrently", return_value=({}, {}))
     @patch("run.build_model_output")
     @patch("sys.argv", ["run.py", "dummy_urls.txt"])
     @patch.dict("os.environ", {"LOG_LEVEL": "1", "LOG_FILE": "/tmp/log.txt", "GITHUB_TOKEN": "fake", "GEN_AI_STUDIO_API_KEY": "fake"})
     @patch("run.validate_github_token", return_value=True)
     @patch("run.GitHubApi.verify_token")
-    def test_url_file_branch(self, mock_verify, mock_validate, mock_build, mock_run, mock_readme, mock_size, mock_parse):
+    def test_url_file_branch(self, mock_verify, mock_validate, mock_build, mock_run, mock_load_tasks, mock_metrics, mock_parse):
         # Simulate one project group
         mock_parse.return_value = [MagicMock(
             model=MagicMock(namespace="ns", repo="repo", rev="rev"),
@@ -338,11 +541,36 @@ class TestRunExtraBranches(unittest.TestCase):
         )]
         run.main()
         mock_parse.assert_called_once_with("dummy_urls.txt")
-        mock_size.assert_called_once()
-        mock_readme.assert_called_once()
+        mock_load_tasks.assert_called_once_with("./tasks.txt")
+        mock_metrics.assert_called_once_with("ns", "repo", "rev", session=run._SESSION)
         mock_run.assert_called_once()
         mock_build.assert_called_once()
 
+    @patch("run.url_class.parse_project_file")
+    @patch("run.get_model_metrics", return_value=(1234, "README.md", "mit"))
+    @patch("run.metric_caller.load_tasks", return_value=[])
+    @patch("run.metric_caller.run_concurrently")
+    @patch("run.build_model_output")
+    @patch("sys.argv", ["run.py", "dummy_urls.txt"])
+    @patch.dict("os.environ", {"LOG_LEVEL": "0", "LOG_FILE": "/tmp/log.txt", "GITHUB_TOKEN": "fake", "GEN_AI_STUDIO_API_KEY": "fake"})
+    @patch("run.validate_github_token", return_value=True)
+    @patch("run.GitHubApi.verify_token")
+    def test_metrics_run_after_all_fetches(self, mock_verify, mock_validate, mock_build, mock_run, mock_load_tasks, mock_metrics, mock_parse):
+        mock_parse.return_value = [
+            MagicMock(model=MagicMock(namespace="ns", repo=f"repo{n}", rev="main"), code=None, dataset=None)
+            for n in range(3)
+        ]
+        seen = []
+
+        def record(*args):
+            # Metric processes are forked here, so the fetch threads must be gone
+            seen.append((mock_metrics.call_count, threading.active_count()))
+            return {}, {}
+
+        mock_run.side_effect = record
+        run.main()
+        self.assertEqual(seen, [(3, 1)] * 3)
+
 
 if __name__ == "__main__":
     unittest.main()